@@ -1,17 +1,34 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import random, time, csv, os
-from collections import deque
+import time, csv, os, atexit
+from dataclasses import dataclass, field
+from enum import IntEnum
 import threading
-import datetime
 import numpy as np
 import pandas as pd
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; BITE core then runs as plain Python
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
 SAMPLE_INTERVAL_MS = 500            
+RENDER_INTERVAL_MS = 1000           # plot refresh cadence, independent of sampling
 PLOT_WINDOW_SEC = 30                
 LOG_CSV = "fault_log.csv"          
+LOG_HEADER = ["timestamp", "sensor_id", "sensor_name", "code", "description", "severity", "value", "details"]
+LOG_FLUSH_ROWS = 32                 # flush the CSV after this many rows (HIGH severity flushes at once)
+BITE_RELOG_SEC = 10.0               # re-log a persisting fault code at most this often
+LOG_MAX_LINES = 1000                # trim the on-screen log back to LOG_KEEP_LINES past this
+LOG_KEEP_LINES = 500
+PLOT_YLIM_TOL = 6                   # default y-limits at nominal +/- PLOT_YLIM_TOL * tol (covers 5*tol spikes)
+BITE_WINDOW = 10                    # recent samples per sensor examined by BITE
+NOISE_BLOCK = 1024                  # standard-normal samples pre-generated per refill
 
 SENSORS = [
     {"id": "S1", "name": "Altitude Sensor", "nominal": 10000.0, "tol": 200.0},
@@ -28,98 +45,209 @@ ERROR_CODES = {
     "OK":  {"desc": "All OK", "severity": "NONE", "recommend": "No action required."}
 }
 
+def ring_size(interval_ms):
+    # Samples in one PLOT_WINDOW_SEC at the given sample interval
+    return int(PLOT_WINDOW_SEC * 1000 / interval_ms) + 1
+
+# Pre-bound template for BITE lines in the on-screen log
+_BITE_FMT = "[BITE][{}] {} {} -> {}: {} | Value={:.2f} | Severity={}".format
+
+# [epoch second, formatted string] of the last timestamp() call
+_ts_cache = [0, ""]
+
 def timestamp():
-    return datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Second resolution, so reformat only when the second changes
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[0] = sec
+        _ts_cache[1] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+    return _ts_cache[1]
+
+_rng = np.random.default_rng()
+
+# Fault injection types; list index is the int code stored in SensorArray.forced_fault
+FAULT_TYPES = ["none", "spike", "noisy", "drift", "stuck", "out_of_range"]
+FAULT_NONE, FAULT_SPIKE, FAULT_NOISY, FAULT_DRIFT, FAULT_STUCK, FAULT_OUT_OF_RANGE = range(len(FAULT_TYPES))
+
+@dataclass
+class SensorArray:
+    # Simulation state for all sensors as parallel arrays (index i <-> SENSORS[i])
+    nominal: np.ndarray
+    tol: np.ndarray
+    noise_level: np.ndarray
+    drift_rate: np.ndarray
+    value: np.ndarray
+    forced_fault: np.ndarray   # FAULT_* codes, set by GUI to inject fault
+    stuck_mask: np.ndarray
+    time: float = 0.0
+    _noise: np.ndarray = field(default_factory=lambda: np.empty(0), init=False, repr=False)
+    _noise_idx: int = field(default=0, init=False, repr=False)
+
+    @classmethod
+    def from_configs(cls, configs):
+        nominal = np.array([float(c["nominal"]) for c in configs])
+        tol = np.array([float(c["tol"]) for c in configs])
+        n = len(configs)
+        return cls(
+            nominal=nominal,
+            tol=tol,
+            noise_level=0.005 * np.abs(nominal) + 0.1,
+            drift_rate=np.zeros(n),
+            value=nominal.copy(),
+            forced_fault=np.zeros(n, dtype=np.int32),
+            stuck_mask=np.zeros(n, dtype=bool),
+        )
+
+    def _standard_normal(self, n):
+        # n N(0, 1) draws served from a pre-generated block, refilled when exhausted
+        if self._noise_idx + n > self._noise.shape[0]:
+            self._noise = _rng.standard_normal(max(NOISE_BLOCK, n))
+            self._noise_idx = 0
+        out = self._noise[self._noise_idx:self._noise_idx + n]
+        self._noise_idx += n
+        return out
+
+    def step_all(self, dt):
+        self.time += dt
+        n = self.nominal.shape[0]
+        fault = self.forced_fault
+
+        value = self.nominal + self.drift_rate * self.time + self._standard_normal(n) * self.noise_level
+
+        # occasional spikes
+        spike = fault == FAULT_SPIKE
+        if spike.any():
+            spike &= _rng.random(n) < 0.02
+            value[spike] += _rng.choice((5.0, -5.0), spike.sum()) * self.tol[spike]
+        noisy = fault == FAULT_NOISY
+        if noisy.any():
+            value[noisy] += self._standard_normal(noisy.sum()) * 3 * self.noise_level[noisy]
+        value = np.where(fault == FAULT_OUT_OF_RANGE, self.nominal + 10 * self.tol, value)
+
+        # drift and stuck latch until reset_faults
+        self.drift_rate = np.where(fault == FAULT_DRIFT, 0.1 * self.tol, self.drift_rate)
+        self.stuck_mask |= fault == FAULT_STUCK
+        self.value = np.where(self.stuck_mask, self.nominal, value)
+        return self.value
 
-def append_log_csv(row):
-    header = ["timestamp", "sensor_id", "sensor_name", "code", "description", "severity", "value", "details"]
-    exists = os.path.exists(LOG_CSV)
-    with open(LOG_CSV, "a", newline="") as f:
-        writer = csv.writer(f)
-        if not exists:
-            writer.writerow(header)
-        writer.writerow(row)
+    def reset_faults(self, index):
+        self.forced_fault[index] = FAULT_NONE
+        self.drift_rate[index] = 0.0
+        self.stuck_mask[index] = False
 
 class SensorSimulator:
-    def __init__(self, config):
+    # Per-sensor handle into a SensorArray: config, fault control and BITE history
+    def __init__(self, array, index, config):
+        self.array = array
+        self.index = index
         self.id = config["id"]
         self.name = config["name"]
         self.nominal = float(config["nominal"])
         self.tol = float(config["tol"])
-        self.time = 0.0
-        self.value = self.nominal
-        self.noise_level = 0.005 * abs(self.nominal) + 0.1
-        # internal bug flags
-        self.forced_fault = None   # set by GUI to inject fault
-        self.drift_rate = 0.0
-        self.stuck_value = None
-        self.last_values = deque(maxlen=10)
-
-    def step(self, dt):
-        self.time += dt
-        # If stuck fault
-        if self.stuck_value is not None:
-            self.value = self.stuck_value
-            self.last_values.append(self.value)
-            return self.value
-
-        self.value = self.nominal + self.drift_rate * self.time
-
-        noise = random.gauss(0, self.noise_level)
-        self.value += noise
-
-        if self.forced_fault == "spike":
-            # occasional spikes
-            if random.random() < 0.02:
-                self.value += random.choice([5, -5]) * self.tol
-        elif self.forced_fault == "noisy":
-            self.value += random.gauss(0, 3 * self.noise_level)
-        elif self.forced_fault == "drift":
-            self.drift_rate = 0.1 * self.tol
-        elif self.forced_fault == "stuck":
-            self.stuck_value = self.nominal
-        elif self.forced_fault == "out_of_range":
-            self.value = self.nominal + 10 * self.tol
-
-        self.last_values.append(self.value)
-        return self.value
+        # BITE history as a mirrored ring: each sample is written twice so the
+        # last BITE_WINDOW values are always one contiguous, oldest-first view
+        self._window = np.zeros(2 * BITE_WINDOW, dtype=np.float64)
+        self._widx = 0
+        self._wfilled = 0
+
+    @property
+    def forced_fault(self):
+        return FAULT_TYPES[self.array.forced_fault[self.index]]
+
+    @forced_fault.setter
+    def forced_fault(self, fault_type):
+        self.array.forced_fault[self.index] = FAULT_TYPES.index(fault_type)
+
+    def record(self, value):
+        self._window[self._widx] = value
+        self._window[self._widx + BITE_WINDOW] = value
+        self._widx = (self._widx + 1) % BITE_WINDOW
+        self._wfilled = min(self._wfilled + 1, BITE_WINDOW)
+
+    def recent(self):
+        # View (no copy) of the last _wfilled samples, oldest first
+        if self._wfilled < BITE_WINDOW:
+            return self._window[:self._wfilled]
+        return self._window[self._widx:self._widx + BITE_WINDOW]
 
     def reset_faults(self):
-        self.forced_fault = None
-        self.drift_rate = 0.0
-        self.stuck_value = None
+        self.array.reset_faults(self.index)
 
 # ---------- Fault detection & classification ----------
-def bite_check(sensor: SensorSimulator, value):
-    # Basic checks: out-of-range, stuck, noisy, drifting, intermittent
-    nominal = sensor.nominal
-    tol = sensor.tol
-    recent = list(sensor.last_values)
-    # If empty recent, small ok
-    if not recent:
-        recent = [value]
+# Integer BITE result codes returned by _bite_core
+class Code(IntEnum):
+    OK = 0
+    E01 = 1
+    E02 = 2
+    E03 = 3
+    E04 = 4
+    E05 = 5
+
+_CODES = tuple(Code)
+# (code, desc, severity, recommend) per Code, resolved once from ERROR_CODES
+_CODE_TABLE = [(c.name, ERROR_CODES[c.name]["desc"], ERROR_CODES[c.name]["severity"], ERROR_CODES[c.name]["recommend"])
+               for c in Code]
+# Details message template per Code
+_BITE_DETAILS = (
+    "Passed BITE",
+    "Value {value:.2f} outside safe range (nom {nominal})",
+    "Intermittent large deltas observed",
+    "No variation in readings — possible stuck sensor",
+    "Mean shifted by {shift:.2f} from nominal",
+    "High noise (std={std:.2f})",
+)
+
+@njit(cache=True, fastmath=True)
+def _bite_core(w, value, nominal, tol):
+    # Basic checks: out-of-range, stuck, noisy, drifting, intermittent.
+    # Returns (code, mean, std); flags are explicit int32, not bools.
+    n = w.shape[0]
 
     # Out of range
     if abs(value - nominal) > 5 * tol:
-        return "E01", f"Value {value:.2f} outside safe range (nom {nominal})"
+        return np.int32(Code.E01), 0.0, 0.0
+
+    # One pass for the sum and the largest consecutive delta
+    s = w[0]
+    max_delta = 0.0
+    for i in range(1, n):
+        s += w[i]
+        d = abs(w[i] - w[i-1])
+        if d > max_delta:
+            max_delta = d
+    mean = s / n
+    ss = 0.0
+    for i in range(n):
+        d = w[i] - mean
+        ss += d * d
+    std = (ss / n) ** 0.5
 
     # Stuck: low variance and close to nominal but not changing
-    if len(recent) >= 6 and np.std(recent) < 1e-6:
-        return "E03", "No variation in readings — possible stuck sensor"
+    if n >= 6 and std < 1e-6:
+        return np.int32(Code.E03), mean, std
 
     # Noisy: high std dev relative to tolerance
-    if np.std(recent) > 0.5 * tol:
-        return "E05", f"High noise (std={np.std(recent):.2f})"
+    if std > 0.5 * tol:
+        return np.int32(Code.E05), mean, std
 
     # Drift: mean deviates slowly over time
-    if abs(np.mean(recent) - nominal) > 1.5 * tol:
-        return "E04", f"Mean shifted by {np.mean(recent)-nominal:.2f} from nominal"
+    if abs(mean - nominal) > 1.5 * tol:
+        return np.int32(Code.E04), mean, std
 
     # Intermittent: occasional large deltas
-    if any(abs(recent[i] - recent[i-1]) > 2 * tol for i in range(1, len(recent))):
-        return "E02", "Intermittent large deltas observed"
+    if max_delta > 2 * tol:
+        return np.int32(Code.E02), mean, std
 
-    return "OK", "Passed BITE"
+    return np.int32(Code.OK), mean, std
+
+def bite_check(sensor: SensorSimulator, value):
+    recent = sensor.recent()
+    # If empty recent, small ok
+    if not recent.size:
+        recent = np.array([value], dtype=np.float64)
+    code, mean, std = _bite_core(recent, float(value), sensor.nominal, sensor.tol)
+    details = _BITE_DETAILS[code].format(value=value, nominal=sensor.nominal, shift=mean - sensor.nominal, std=std)
+    return _CODES[code], details
 
 # ---------- GUI Application ----------
 class AvionicsMonitorApp:
@@ -129,9 +257,20 @@ class AvionicsMonitorApp:
         root.geometry("1100x700")
 
         # Setup sensors
-        self.sensors = [SensorSimulator(cfg) for cfg in SENSORS]
+        self.sensor_array = SensorArray.from_configs(SENSORS)
+        self.sensors = [SensorSimulator(self.sensor_array, i, cfg) for i, cfg in enumerate(SENSORS)]
+        self.sensors_by_id = {s.id: s for s in self.sensors}
         self.start_time = time.time()
-        self.data_buffers = {s.id: deque() for s in self.sensors}  # (timestamp, value)
+        # Per-sensor SoA ring buffers: timestamps and values in parallel arrays
+        # sized to one PLOT_WINDOW_SEC; resized when the sample interval changes
+        self.ring_size = ring_size(SAMPLE_INTERVAL_MS)
+        self.ts = {s.id: np.empty(self.ring_size, dtype=np.float64) for s in self.sensors}
+        self.vs = {s.id: np.empty(self.ring_size, dtype=np.float64) for s in self.sensors}
+        self.head = {s.id: 0 for s in self.sensors}   # next slot to write
+        self.count = {s.id: 0 for s in self.sensors}  # number of valid samples
+
+        # Sample interval in use; updated from the Entry only when the user edits it
+        self._interval_ms = SAMPLE_INTERVAL_MS
 
         # Create UI frames
         self.create_controls_frame()
@@ -139,15 +278,23 @@ class AvionicsMonitorApp:
         self.create_status_frame()
         self.create_log_frame()
 
-        # Ensure log file exists
-        if not os.path.exists(LOG_CSV):
-            with open(LOG_CSV, "w") as f:
-                f.write("")
+        # Keep the log CSV open for the app lifetime; rows are flushed in batches
+        self._log_fh = open(LOG_CSV, "a", newline="")
+        self._log_writer = csv.writer(self._log_fh)
+        if self._log_fh.tell() == 0:
+            self._log_writer.writerow(LOG_HEADER)
+        self._log_rows_since_flush = 0
+        atexit.register(self._log_fh.close)
 
-        # Start periodic sampling
+        # Last BITE code per sensor and when it was last logged
+        self._last_code = {s.id: Code.OK for s in self.sensors}
+        self._last_log_t = {s.id: 0.0 for s in self.sensors}
+
+        # Start periodic sampling and plot refresh as independent timer chains
         self.running = True
         self.last_update = time.time()
-        self.root.after(SAMPLE_INTERVAL_MS, self.update_loop)
+        self.root.after(SAMPLE_INTERVAL_MS, self._sample_tick)
+        self.root.after(RENDER_INTERVAL_MS, self._render_tick)
 
     def create_controls_frame(self):
         frm = ttk.LabelFrame(self.root, text="Controls / Fault Injection", padding=8)
@@ -159,7 +306,7 @@ class AvionicsMonitorApp:
         self.sensor_combo.grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Label(frm, text="Inject Fault:").grid(row=1, column=0, sticky="w")
-        self.fault_choice = ttk.Combobox(frm, values=["none", "spike", "noisy", "drift", "stuck", "out_of_range"], state="readonly")
+        self.fault_choice = ttk.Combobox(frm, values=FAULT_TYPES, state="readonly")
         self.fault_choice.current(0)
         self.fault_choice.grid(row=1, column=1, padx=5, pady=5)
 
@@ -170,7 +317,10 @@ class AvionicsMonitorApp:
         ttk.Button(frm, text="Run BITE (All Sensors)", command=self.run_bite_all).grid(row=3, column=0, columnspan=2, pady=8)
         ttk.Label(frm, text="Sample Interval (ms):").grid(row=4, column=0, sticky="w")
         self.interval_var = tk.IntVar(value=SAMPLE_INTERVAL_MS)
-        tk.Entry(frm, textvariable=self.interval_var, width=10).grid(row=4, column=1, sticky="w")
+        interval_entry = tk.Entry(frm, textvariable=self.interval_var, width=10)
+        interval_entry.grid(row=4, column=1, sticky="w")
+        interval_entry.bind("<Return>", self.on_interval_changed)
+        interval_entry.bind("<FocusOut>", self.on_interval_changed)
 
     def create_plot_frame(self):
         frm = ttk.LabelFrame(self.root, text="Real-time Sensor Trends", padding=6)
@@ -179,14 +329,31 @@ class AvionicsMonitorApp:
         # Matplotlib figure
         self.fig = Figure(figsize=(7,4), dpi=100)
         self.axes = {}
+        self.lines = {}
+        self.bands = {}
+        self.no_data = {}
+        self.default_ylim = {}
         for i, s in enumerate(self.sensors):
             ax = self.fig.add_subplot(len(self.sensors), 1, i+1)
-            ax.set_ylabel(f"{s.id} ({s.name.split()[0]})")
+            ax.set_ylabel(f"{s.id}: {s.name.split()[0]}")
             ax.grid(True)
+            # static nominal line and tolerance band, part of the cached background
+            ax.axhline(s.nominal, linestyle="--", linewidth=0.7)
+            self.bands[s.id] = ax.axhspan(s.nominal - s.tol, s.nominal + s.tol, alpha=0.1)
+            # stable limits so the cached background stays valid between frames;
+            # x is time relative to the latest sample, y only widens when data leaves it
+            ax.set_xlim(-PLOT_WINDOW_SEC, 0)
+            self.default_ylim[s.id] = (s.nominal - PLOT_YLIM_TOL * s.tol, s.nominal + PLOT_YLIM_TOL * s.tol)
+            ax.set_ylim(*self.default_ylim[s.id])
+            self.no_data[s.id] = ax.text(0.5, 0.5, "No data", transform=ax.transAxes, ha="center")
+            self.lines[s.id], = ax.plot([], [], animated=True)
             self.axes[s.id] = ax
+        ax.set_xlabel("Time relative to latest sample (s)")
         self.fig.tight_layout()
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=frm)
+        self.backgrounds = {}
+        self.canvas.mpl_connect("draw_event", self.on_canvas_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
@@ -210,6 +377,8 @@ class AvionicsMonitorApp:
         frm = ttk.LabelFrame(self.root, text="Fault Log & BITE Output", padding=6)
         frm.place(x=10, y=440, width=1080, height=250)
         self.log_widget = scrolledtext.ScrolledText(frm, height=10)
+        self._log_lines = 0
+        self._log_queue = []
         self.log_widget.pack(fill="both", expand=True)
 
         ttk.Button(frm, text="Export Log CSV", command=self.export_csv).pack(side="right", padx=8, pady=6)
@@ -221,7 +390,7 @@ class AvionicsMonitorApp:
             return
         sensor_id = sel.split()[0]
         fault_type = self.fault_choice.get()
-        sensor = next((s for s in self.sensors if s.id == sensor_id), None)
+        sensor = self.sensors_by_id.get(sensor_id)
         if not sensor:
             return
         if fault_type == "none":
@@ -231,6 +400,19 @@ class AvionicsMonitorApp:
             sensor.forced_fault = fault_type
             self.log(f"[{timestamp()}] Injected fault '{fault_type}' into {sensor.id}")
 
+    def on_interval_changed(self, event=None):
+        try:
+            interval = int(self.interval_var.get())
+        except (tk.TclError, ValueError):
+            interval = 0
+        if interval <= 0:
+            # restore the last valid interval
+            self.interval_var.set(self._interval_ms)
+            return
+        if interval != self._interval_ms:
+            self._interval_ms = interval
+            self.resize_sample_buffers(ring_size(interval))
+
     def clear_faults(self):
         for s in self.sensors:
             s.reset_faults()
@@ -239,36 +421,86 @@ class AvionicsMonitorApp:
     def run_bite_all(self):
         # Run BITE check for all sensors using latest values
         for s in self.sensors:
-            buff = list(self.data_buffers[s.id])
-            if not buff:
+            if not self.count[s.id]:
                 self.log(f"[{timestamp()}] BITE: {s.id} - No data available")
                 continue
-            _, latest = buff[-1]
+            latest = float(self.vs[s.id][(self.head[s.id] - 1) % self.ring_size])
             code, desc = bite_check(s, latest)
-            info = ERROR_CODES.get(code, {"desc":"Unknown","severity":"UNKNOWN","recommend":""})
             self.log_bite(s, code, desc, latest)
 
     def export_csv(self):
+        self.flush_log_csv()
         if not os.path.exists(LOG_CSV):
             messagebox.showinfo("Export", "No log CSV present yet.")
         else:
             messagebox.showinfo("Export", f"Log exported as {os.path.abspath(LOG_CSV)}")
 
+    # ---------- Sample buffers ----------
+    def push_sample(self, sensor_id, t, value):
+        head = self.head[sensor_id]
+        self.ts[sensor_id][head] = t
+        self.vs[sensor_id][head] = value
+        self.head[sensor_id] = (head + 1) % self.ring_size
+        if self.count[sensor_id] < self.ring_size:
+            self.count[sensor_id] += 1
+
+    def ordered_samples(self, sensor_id):
+        # (timestamps, values) arrays for a sensor, oldest first
+        count = self.count[sensor_id]
+        idx = (self.head[sensor_id] - count + np.arange(count)) % self.ring_size
+        return self.ts[sensor_id][idx], self.vs[sensor_id][idx]
+
+    def resize_sample_buffers(self, size):
+        # Reallocate every ring to `size`, keeping the newest samples that fit
+        for sensor_id in self.ts:
+            ts, vs = self.ordered_samples(sensor_id)
+            keep = min(ts.size, size)
+            self.ts[sensor_id] = np.empty(size, dtype=np.float64)
+            self.vs[sensor_id] = np.empty(size, dtype=np.float64)
+            self.ts[sensor_id][:keep] = ts[ts.size - keep:]
+            self.vs[sensor_id][:keep] = vs[vs.size - keep:]
+            self.head[sensor_id] = keep % size
+            self.count[sensor_id] = keep
+        self.ring_size = size
+
     # ---------- Logging ----------
     def log(self, text):
-        self.log_widget.insert(tk.END, text + "\n")
+        # Queued; flush_log_widget inserts the batch on the next render tick
+        self._log_queue.append(text + "\n")
+
+    def flush_log_widget(self):
+        if not self._log_queue:
+            return
+        self.log_widget.insert(tk.END, "".join(self._log_queue))
+        self._log_lines += len(self._log_queue)
+        self._log_queue.clear()
+        # Tk text redraw cost grows with content; keep only the newest lines
+        if self._log_lines > LOG_MAX_LINES:
+            self.log_widget.delete("1.0", f"end-{LOG_KEEP_LINES + 1}l")
+            self._log_lines = LOG_KEEP_LINES
         self.log_widget.see(tk.END)
 
+    def append_log_csv(self, row, severity):
+        self._log_writer.writerow(row)
+        self._log_rows_since_flush += 1
+        if self._log_rows_since_flush >= LOG_FLUSH_ROWS or severity == "HIGH":
+            self.flush_log_csv()
+
+    def flush_log_csv(self):
+        self._log_fh.flush()
+        self._log_rows_since_flush = 0
+
     def log_bite(self, sensor, code, details, value):
-        info = ERROR_CODES.get(code, {"desc":"Unknown","severity":"UNKNOWN","recommend":""})
-        row = [timestamp(), sensor.id, sensor.name, code, info["desc"], info["severity"], f"{value:.3f}", details]
-        append_log_csv(row)
-        self.log(f"[BITE][{timestamp()}] {sensor.id} {sensor.name} -> {code}: {info['desc']} | Value={value:.2f} | Severity={info['severity']}")
+        code_str, desc, severity, recommend = _CODE_TABLE[code]
+        ts = timestamp()
+        row = [ts, sensor.id, sensor.name, code_str, desc, severity, f"{value:.3f}", details]
+        self.append_log_csv(row, severity)
+        self.log(_BITE_FMT(ts, sensor.id, sensor.name, code_str, desc, value, severity))
         # Show maintenance recommendation for high severity
-        if info["severity"] in ("HIGH", "MEDIUM"):
-            self.reco_text.set(info["recommend"])
+        if severity in ("HIGH", "MEDIUM"):
+            self.reco_text.set(recommend)
         # update color-coded status
-        self.update_health_label(sensor.id, info["severity"])
+        self.update_health_label(sensor.id, severity)
 
     def update_health_label(self, sensor_id, severity):
         lbl = self.health_labels.get(sensor_id)
@@ -283,56 +515,83 @@ class AvionicsMonitorApp:
         else:
             lbl.config(text="OK", background="lightgreen")
 
-    # ---------- Main update loop ----------
-    def update_loop(self):
-        # adapt interval if user changed
-        try:
-            interval = int(self.interval_var.get())
-        except Exception:
-            interval = SAMPLE_INTERVAL_MS
-        self.root.after(interval, self.update_loop)
+    # ---------- Main update loops ----------
+    def _sample_tick(self):
+        self.root.after(self._interval_ms, self._sample_tick)
 
         now = time.time()
         dt = now - self.last_update if self.last_update else 0.0
         self.last_update = now
 
-        # Sample sensors
-        for s in self.sensors:
-            val = s.step(dt)
-            t = now - self.start_time
-            self.data_buffers[s.id].append((t, val))
-
-            # keep only PLOT_WINDOW_SEC
-            while self.data_buffers[s.id] and (t - self.data_buffers[s.id][0][0]) > PLOT_WINDOW_SEC:
-                self.data_buffers[s.id].popleft()
+        # Sample all sensors in one vectorized step
+        values = self.sensor_array.step_all(dt).tolist()
+        t = now - self.start_time
+        for s, val in zip(self.sensors, values):
+            s.record(val)
+            self.push_sample(s.id, t, val)
 
             # Run BITE check each sample (or could be periodic)
             code, details = bite_check(s, val)
-            if code != "OK":
+            # Coalesce repeats: log a fault when it first appears, then at most
+            # every BITE_RELOG_SEC while it persists
+            if code != Code.OK and (code != self._last_code[s.id] or now - self._last_log_t[s.id] > BITE_RELOG_SEC):
                 self.log_bite(s, code, details, val)
+                self._last_log_t[s.id] = now
+            self._last_code[s.id] = code
 
-        # Update plots
+    def _render_tick(self):
+        self.root.after(RENDER_INTERVAL_MS, self._render_tick)
         self.refresh_plots()
+        self.flush_log_widget()
+
+    def on_canvas_draw(self, event):
+        # Full redraw (startup/resize/limit change): re-cache each axes background for blitting
+        for s in self.sensors:
+            ax = self.axes[s.id]
+            self.backgrounds[s.id] = self.canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(self.lines[s.id])
 
     def refresh_plots(self):
+        full_redraw = False
+        for s in self.sensors:
+            xs, ys = self.ordered_samples(s.id)
+            if not xs.size:
+                continue
+            self.lines[s.id].set_data(xs - xs[-1], ys)
+            if self.no_data[s.id].get_visible():
+                self.no_data[s.id].set_visible(False)
+                full_redraw = True
+            if self.update_ylim(s, float(ys.min()), float(ys.max())):
+                full_redraw = True
+
+        if full_redraw:
+            # background changed; on_canvas_draw re-caches it and draws the lines
+            self.canvas.draw_idle()
+            return
         for s in self.sensors:
+            bg = self.backgrounds.get(s.id)
+            if bg is None:
+                continue
             ax = self.axes[s.id]
-            ax.clear()
-            data = list(self.data_buffers[s.id])
-            if data:
-                xs, ys = zip(*data)
-                ax.plot(xs, ys)
-                ax.set_xlim(max(0, xs[-1]-PLOT_WINDOW_SEC), xs[-1] if xs else PLOT_WINDOW_SEC)
-                ax.set_ylabel(f"{s.id}: {s.name.split()[0]}")
-                # show nominal and tolerance band
-                ax.axhline(s.nominal, linestyle="--", linewidth=0.7)
-                ax.fill_between(xs, [s.nominal - s.tol]*len(xs), [s.nominal + s.tol]*len(xs), alpha=0.1)
-            else:
-                ax.set_ylabel(f"{s.id}")
-                ax.text(0.5, 0.5, "No data", transform=ax.transAxes, ha="center")
-            ax.grid(True)
-        self.fig.tight_layout()
-        self.canvas.draw()
+            self.canvas.restore_region(bg)
+            ax.draw_artist(self.lines[s.id])
+            self.canvas.blit(ax.bbox)
+
+    def update_ylim(self, s, ymin, ymax):
+        # Keep the trace on the axes; returns True if the limits changed
+        ax = self.axes[s.id]
+        lo, hi = ax.get_ylim()
+        d_lo, d_hi = self.default_ylim[s.id]
+        if ymin < lo or ymax > hi:
+            # widen with headroom so a growing drift doesn't force a full redraw every frame
+            margin = 0.25 * (max(ymax, d_hi) - min(ymin, d_lo))
+            ax.set_ylim(min(ymin - margin, d_lo), max(ymax + margin, d_hi))
+            return True
+        if (lo, hi) != (d_lo, d_hi) and ymin >= d_lo and ymax <= d_hi:
+            # data is back inside the default range
+            ax.set_ylim(d_lo, d_hi)
+            return True
+        return False
 
 # ---------- Run application ----------
 def main():